@@ -0,0 +1,32 @@
+"""Scripts used to prepare course material for the Accessible Docs webapp.
+
+Submodules are loaded on first attribute access so that importing the package
+(or a single step, e.g. from a watcher or cron hook) stays cheap.
+"""
+import importlib
+
+_SUBMODULES = frozenset([
+    'cleanup',
+    'crawford_remove_duedate',
+    'delete_empty_folders',
+    'delete_irrelevant_folders',
+    'dir_to_html',
+    'dir_to_json',
+    'download',
+    'fsutils',
+    'move_to_root_folder',
+    'moveup',
+    'rename_and_restructure_html_files',
+    'rename_crawfordtech_folders',
+    'unzip',
+])
+
+__all__ = sorted(_SUBMODULES)
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
@@ -1,9 +1,10 @@
 # cleanup.py
 import sys
-from delete_irrelevant_folders import main as delete_main
-from move_to_root_folder import main as move_main
-from unzip import main as unzip_main
-from rename_and_restructure_html_files import main as rename_main
+
+from .delete_irrelevant_folders import main as delete_main
+from .move_to_root_folder import main as move_main
+from .unzip import main as unzip_main
+from .rename_and_restructure_html_files import main as rename_main
 
 def cleanup(root_folder):
     delete_main(root_folder)
@@ -11,10 +12,13 @@ def cleanup(root_folder):
     unzip_main(root_folder)
     rename_main(root_folder)
 
-if __name__ == "__main__":
+def cli():
     if len(sys.argv) != 2:
-        print("Usage: python3 cleanup.py <root_folder>")
+        print("Usage: python3 -m accessible_docs.cleanup <root_folder>")
         sys.exit(1)  # Exit the script if the root_folder argument is not provided
 
     root_folder = sys.argv[1]  # Get the root folder from the command line
     cleanup(root_folder)
+
+if __name__ == "__main__":
+    cli()
@@ -1,7 +1,8 @@
 import os
-import shutil
 import re
 
+from .fsutils import delete_folder, move_folder_contents_to_parent
+
 def delete_log_files(root_folder):
     for dirpath, dirnames, filenames in os.walk(root_folder):
         for filename in filenames:
@@ -10,25 +11,6 @@ def delete_log_files(root_folder):
                 os.remove(file_path)
                 print(f"Deleted file '{file_path}'.")
 
-def move_folder_contents_to_parent(child_folder_path, parent_folder_path):
-    for filename in os.listdir(child_folder_path):
-        if filename != '.DS_Store':
-            src_path = os.path.join(child_folder_path, filename)
-            dst_path = os.path.join(parent_folder_path, filename)
-
-            if os.path.exists(dst_path):
-                if os.path.isdir(dst_path):
-                    shutil.rmtree(dst_path)
-                else:
-                    os.remove(dst_path)
-
-            shutil.move(src_path, dst_path)
-
-def delete_folder(folder_path):
-    if os.path.isdir(folder_path):
-        shutil.rmtree(folder_path)
-        print(f"Deleted folder '{folder_path}'.")
-
 def check_subfolders(root_folder): 
     subfolders = [f.path for f in os.scandir(root_folder) if f.is_dir()] 
     for course_folder in subfolders:
@@ -38,7 +20,9 @@ def check_subfolders(root_folder):
             # Check if the course-due-date folder name contains "Due"
             if re.search(r'\bDue\b', course_due_date_folder_name):
                 print(f"Moving contents of '{course_due_date_folder}' to '{course_folder}'.")
-                move_folder_contents_to_parent(course_due_date_folder, course_folder)
+                if move_folder_contents_to_parent(course_due_date_folder, course_folder):
+                    print(f"Keeping folder '{course_due_date_folder}': some entries could not be moved.")
+                    continue
                 print(f"Deleting folder '{course_due_date_folder}'.")
                 delete_folder(course_due_date_folder)
 
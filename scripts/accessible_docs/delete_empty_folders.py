@@ -0,0 +1,8 @@
+from .fsutils import delete_empty_folders
+
+def main(root_folder):
+    delete_empty_folders(root_folder)
+
+if __name__ == "__main__":
+    root_folder = '/Users/jeremiah/Documents/CrawfordTech'  
+    main(root_folder)
@@ -1,12 +1,7 @@
 import os
 import shutil
 
-def delete_empty_folders(root_folder):
-    for dirpath, dirnames, filenames in os.walk(root_folder, topdown=False):
-        for dirname in dirnames:
-            folder_path = os.path.join(dirpath, dirname)
-            if not any(os.scandir(folder_path)):
-                os.rmdir(folder_path)
+from .fsutils import delete_empty_folders
 
 def check_and_delete_if_no_completed_subfolder(root_folder): 
     subfolders = [f.path for f in os.scandir(root_folder) if f.is_dir()] 
@@ -22,7 +17,7 @@ def check_and_delete_if_no_completed_subfolder(root_folder):
             shutil.rmtree(folder_path)
 
 def main(root_folder):
-    delete_empty_folders(root_folder)
+    delete_empty_folders(root_folder, verbose=False)
     check_and_delete_if_no_completed_subfolder(root_folder)
 
 # if __name__ == "__main__":
@@ -10,9 +10,6 @@ def dir_to_dict(path):
         elif not os.path.isdir(item_path) and item != '.DS_Store':    
             dir_dict['children'].append({'type': 'file', 'name': item})
     return dir_dict
-path = '/Users/jeremiah/Documents/CrawfordTech' # Replace with your actual root folder path
-root_folder_name= os.path.basename(path)
-directory_tree_dict = dir_to_dict(path)
 
 # Conversion of JSON to HTML
 def json_to_html(json_dict, depth=0):
@@ -33,10 +30,17 @@ def json_to_html(json_dict, depth=0):
 
     return html_content
 
-html_content = json_to_html(directory_tree_dict)
+def main(path):
+    root_folder_name = os.path.basename(path)
+    directory_tree_dict = dir_to_dict(path)
+    html_content = json_to_html(directory_tree_dict)
 
-with open(f'{root_folder_name}.html', 'w') as html_file:
-    html_file.write(html_content)
+    with open(f'{root_folder_name}.html', 'w') as html_file:
+        html_file.write(html_content)
+
+if __name__ == "__main__":
+    path = '/Users/jeremiah/Documents/CrawfordTech' # Replace with your actual root folder path
+    main(path)
 
 # **************
 
@@ -26,10 +26,13 @@ def dir_to_dict(path, parent_name=None):
     
     return dir_dict
 
-directory_tree_dict = dir_to_dict('/Users/jeremiah/Documents/A11yGator')
+def main(root_folder, output_path):
+    directory_tree_dict = dir_to_dict(root_folder)
 
-output_path = '/Users/jeremiah/Documents/A11yGator/data.json'
-with open(output_path, 'w') as f:
-    json.dump(directory_tree_dict, f, indent=4)
+    with open(output_path, 'w') as f:
+        json.dump(directory_tree_dict, f, indent=4)
 
-print(f"Directory tree saved to {output_path}")
+    print(f"Directory tree saved to {output_path}")
+
+if __name__ == "__main__":
+    main('/Users/jeremiah/Documents/A11yGator', '/Users/jeremiah/Documents/A11yGator/data.json')
@@ -1,6 +1,3 @@
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
-from google.oauth2.service_account import Credentials
 import io
 import os
 
@@ -11,6 +8,10 @@ SCOPES = ['https://www.googleapis.com/auth/drive.readonly']
 SERVICE_ACCOUNT_FILE = 'credentials.json'
 
 def authenticate_gdrive_api():
+    # The Google client libraries are slow to import, so only load them when a download actually runs.
+    from googleapiclient.discovery import build
+    from google.oauth2.service_account import Credentials
+
     try:
         credentials = Credentials.from_service_account_file(
             SERVICE_ACCOUNT_FILE, scopes=SCOPES)
@@ -27,6 +28,8 @@ def download_file(service, file_id, filepath, mime_type):
 
     print(f"Preparing to download file: {filepath} with MIME type: {mime_type}")
 
+    from googleapiclient.http import MediaIoBaseDownload
+
     try:
         request = service.files().get_media(fileId=file_id)
         fh = io.FileIO(filepath, 'wb')
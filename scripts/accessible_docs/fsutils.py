@@ -0,0 +1,212 @@
+import errno
+import os
+import shutil
+import sys
+import tempfile
+from collections import namedtuple
+
+# Finder metadata files that should never be treated as real content.
+IGNORED_NAMES = frozenset(['.DS_Store'])
+
+# An entry that move_folder_contents_to_parent left in place rather than overwrite.
+MoveConflict = namedtuple('MoveConflict', ['src', 'dst', 'reason'])
+
+def is_empty_dir(path):
+    """Check if the directory has no entries, without listing all of them."""
+    with os.scandir(path) as entries:
+        return next(entries, None) is None
+
+def has_files(path):
+    """Check if the directory tree has at least one file, stopping at the first one found.
+
+    Like os.walk, symlinks to folders are not counted or followed and unreadable folders are skipped.
+    """
+    stack = [path]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    return True
+                if not entry.is_symlink():
+                    stack.append(entry.path)
+    return False
+
+def delete_folder(folder_path):
+    """Delete the specified folder."""
+    if os.path.isdir(folder_path):
+        shutil.rmtree(folder_path)
+        print(f"Deleted folder '{folder_path}'.")
+
+def delete_empty_folders(root_folder, verbose=True):
+    """Delete all empty folders in the directory, deepest first."""
+    for dirpath, dirnames, _ in os.walk(root_folder, topdown=False):
+        for dirname in dirnames:
+            folder_path = os.path.join(dirpath, dirname)
+            if is_empty_dir(folder_path):
+                os.rmdir(folder_path)
+                if verbose:
+                    print(f"Deleted empty folder '{folder_path}'.")
+
+# Linux renameat2(2) constants, see <fcntl.h> and <linux/fs.h>.
+_AT_FDCWD = -100
+_RENAME_NOREPLACE = 1
+
+# Resolved on first use so importing this module doesn't pay for ctypes.
+_renameat2 = None
+
+def _load_renameat2():
+    """Return libc's renameat2, or False if this platform doesn't provide it."""
+    if not sys.platform.startswith('linux'):
+        return False
+    import ctypes
+    try:
+        fn = ctypes.CDLL(None, use_errno=True).renameat2
+    except (AttributeError, OSError):
+        return False  # glibc < 2.28 or a libc without the wrapper
+
+    def check(result, func, args):
+        if result != 0:
+            err = ctypes.get_errno()
+            # OSError picks the matching subclass, e.g. FileExistsError for EEXIST.
+            raise OSError(err, os.strerror(err), os.fsdecode(args[1]), None, os.fsdecode(args[3]))
+        return result
+
+    fn.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    fn.restype = ctypes.c_int
+    fn.errcheck = check
+    return fn
+
+def rename_noreplace(src_path, dst_path):
+    """Atomically rename src_path to dst_path, raising FileExistsError instead of overwriting."""
+    global _renameat2
+    if _renameat2 is None:
+        _renameat2 = _load_renameat2()
+
+    if _renameat2:
+        try:
+            _renameat2(_AT_FDCWD, os.fsencode(src_path), _AT_FDCWD, os.fsencode(dst_path), _RENAME_NOREPLACE)
+            return
+        except OSError as e:
+            if e.errno not in (errno.EINVAL, errno.ENOSYS):
+                raise
+            # The filesystem doesn't support RENAME_NOREPLACE, fall back to checking first.
+
+    if os.path.lexists(dst_path):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), src_path, None, dst_path)
+    os.rename(src_path, dst_path)
+
+def _list_entries(path):
+    """Return {name: is_dir} for the directory, with a single scandir call."""
+    with os.scandir(path) as entries:
+        return {entry.name: entry.is_dir(follow_symlinks=False) for entry in entries}
+
+def _copy_into_place(src_path, dst_path, replace):
+    """Copy a file next to dst_path, swap it in with a rename, and only then remove the source."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(dst_path), prefix=f'.{os.path.basename(dst_path)}.')
+    os.close(fd)
+    try:
+        shutil.copy2(src_path, tmp_path)
+        if replace:
+            os.replace(tmp_path, dst_path)
+        else:
+            rename_noreplace(tmp_path, dst_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    os.remove(src_path)
+
+def _move_across_devices(src_path, dst_path, src_is_dir):
+    if os.path.islink(src_path):
+        os.symlink(os.readlink(src_path), dst_path)
+        os.remove(src_path)
+    elif src_is_dir:
+        # copytree creates dst_path itself, so it raises FileExistsError rather than copying into it.
+        shutil.copytree(src_path, dst_path, symlinks=True)
+        shutil.rmtree(src_path)
+    else:
+        _copy_into_place(src_path, dst_path, replace=False)
+
+def _move_entry(src_path, dst_path, src_is_dir):
+    """Rename src_path to dst_path without replacing anything, copying only if they're on different devices."""
+    try:
+        rename_noreplace(src_path, dst_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        _move_across_devices(src_path, dst_path, src_is_dir)
+
+def _replace_file(src_path, dst_path):
+    try:
+        os.replace(src_path, dst_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        _copy_into_place(src_path, dst_path, replace=True)
+
+def _contains(folder, path):
+    """Check if path is folder itself or somewhere inside it, after resolving symlinks."""
+    folder = os.path.realpath(folder)
+    return os.path.commonpath([folder, path]) == folder
+
+def _merge_folder(src_dir, dst_dir, source_root, conflicts, verbose):
+    # Both sides are listed once up front, so the per-entry work is just the rename itself.
+    existing = _list_entries(dst_dir)
+    for name, src_is_dir in _list_entries(src_dir).items():
+        if name in IGNORED_NAMES:
+            continue
+        src_path = os.path.join(src_dir, name)
+        dst_path = os.path.join(dst_dir, name)
+
+        if name not in existing:
+            try:
+                _move_entry(src_path, dst_path, src_is_dir)
+            except FileExistsError:
+                # Something appeared at the destination after it was listed.
+                conflicts.append(MoveConflict(src_path, dst_path, 'destination appeared during move'))
+                continue
+            if verbose:
+                print(f"Moved '{src_path}' to '{dst_path}'.")
+        elif src_is_dir and existing[name]:
+            if _contains(dst_path, source_root):
+                # The child sits inside the parent, so e.g. 'Due Jan 5/Due Jan 5' would be merged into
+                # the folder it is being moved out of, and deleted with it afterwards.
+                conflicts.append(MoveConflict(src_path, dst_path, 'destination contains the source folder'))
+                continue
+            _merge_folder(src_path, dst_path, source_root, conflicts, verbose)
+            if all(leftover in IGNORED_NAMES for leftover in _list_entries(src_path)):
+                shutil.rmtree(src_path)
+        elif not src_is_dir and not existing[name]:
+            _replace_file(src_path, dst_path)
+            if verbose:
+                print(f"Replaced '{dst_path}' with '{src_path}'.")
+        else:
+            kind = 'folder over file' if src_is_dir else 'file over folder'
+            conflicts.append(MoveConflict(src_path, dst_path, kind))
+
+def move_folder_contents_to_parent(child_folder_path, parent_folder_path, verbose=False):
+    """Move the contents of the child folder to the parent folder, merging folders that already exist.
+
+    Every move is tried as a rename first, so on the same device no file data is copied. Entries on
+    another device (e.g. a mount point inside the tree) are copied and then removed. Entries that
+    can't be moved without losing data (a file colliding with a folder, or a folder that would be
+    merged into the child folder itself or one of its ancestors) are left in the child folder and
+    returned as conflicts.
+
+    A file that collides with a file is deliberately not a conflict: the child's copy is the newer
+    remediated version, so it atomically replaces the old one, as the scripts always have. These
+    replacements are only printed when verbose is set.
+    """
+    conflicts = []
+    source_root = os.path.realpath(child_folder_path)
+    _merge_folder(child_folder_path, parent_folder_path, source_root, conflicts, verbose)
+    for conflict in conflicts:
+        print(f"Conflict: could not move '{conflict.src}' to '{conflict.dst}' ({conflict.reason}).")
+    return conflicts
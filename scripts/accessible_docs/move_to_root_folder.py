@@ -1,19 +1,7 @@
 import os
 import shutil
 
-def move_completed_folder_contents_to_parent(child_folder_path, parent_folder_path):
-    for filename in os.listdir(child_folder_path):
-        if filename != '.DS_Store':
-            src_path = os.path.join(child_folder_path, filename)
-            dst_path = os.path.join(parent_folder_path, filename)
-
-            if os.path.exists(dst_path):
-                if os.path.isdir(dst_path):
-                    shutil.rmtree(dst_path)
-                else:
-                    os.remove(dst_path)
-
-            shutil.move(src_path, dst_path)
+from .fsutils import move_folder_contents_to_parent
 
 def delete_specific_folders(parent_folder, folders_to_delete):
     for folder in folders_to_delete:
@@ -34,23 +22,23 @@ def check_direct_subfolders_for_completed(root_folder):
 
         if os.path.exists(completed_folder_path1):
             print(f"Moving contents of '{completed_folder_path1}' to '{folder_path}'.")
-            move_completed_folder_contents_to_parent(completed_folder_path1, folder_path)
-            delete_specific_folders(folder_path, ['Text to Speech, including image_formula_equation descriptions'])
+            if not move_folder_contents_to_parent(completed_folder_path1, folder_path):
+                delete_specific_folders(folder_path, ['Text to Speech, including image_formula_equation descriptions'])
         
         if os.path.exists(completed_folder_path2):
             print(f"Moving contents of '{completed_folder_path2}' to '{folder_path}'.")
-            move_completed_folder_contents_to_parent(completed_folder_path2, folder_path)
-            delete_specific_folders(folder_path, ['Full Remediation'])
+            if not move_folder_contents_to_parent(completed_folder_path2, folder_path):
+                delete_specific_folders(folder_path, ['Full Remediation'])
 
         if os.path.exists(completed_folder_path3):
             print(f"Moving contents of '{completed_folder_path3}' to '{folder_path}'.")
-            move_completed_folder_contents_to_parent(completed_folder_path3, folder_path)
-            delete_specific_folders(folder_path, ['Magnification'])
+            if not move_folder_contents_to_parent(completed_folder_path3, folder_path):
+                delete_specific_folders(folder_path, ['Magnification'])
 
         if os.path.exists(completed_folder_path4):
             print(f"Moving contents of '{completed_folder_path4}' to '{folder_path}'.")
-            move_completed_folder_contents_to_parent(completed_folder_path4, folder_path)
-            delete_specific_folders(folder_path, ['Text to Speech, no image_formula_equation descriptions'])
+            if not move_folder_contents_to_parent(completed_folder_path4, folder_path):
+                delete_specific_folders(folder_path, ['Text to Speech, no image_formula_equation descriptions'])
 
 def main(root_folder):
     check_direct_subfolders_for_completed(root_folder)
@@ -1,7 +1,8 @@
 import os
-from bs4 import BeautifulSoup
 import shutil
 
+from .fsutils import rename_noreplace
+
 def rename_html_directories(root_folder):
     for dirpath, dirnames, filenames in os.walk(root_folder, topdown=False):
         for dirname in dirnames:
@@ -12,6 +13,9 @@ def rename_html_directories(root_folder):
                 print(f"Renamed directory '{old_dirpath}' to '{new_dirpath}'.")
 
 def rename_html_files(root_folder):
+    # bs4 is only needed here, so keep it out of the import path of the other cleanup steps.
+    from bs4 import BeautifulSoup
+
     for dirpath, dirnames, filenames in os.walk(root_folder):
         for filename in filenames:
             if filename.endswith('.html') or filename.endswith('.htm'):
@@ -32,9 +36,9 @@ def rename_html_files(root_folder):
                     new_filepath = os.path.join(dirpath, new_filename)
 
                     # Ensure the new filename does not already exist in the directory
-                    if not os.path.exists(new_filepath):
-                        os.rename(filepath, new_filepath)
-                    else:
+                    try:
+                        rename_noreplace(filepath, new_filepath)
+                    except FileExistsError:
                         print(f"Error: File '{new_filepath}' already exists.")
                 else:
                     print(f"Error: No title tag found in '{filepath}'.")
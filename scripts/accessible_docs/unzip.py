@@ -1,7 +1,8 @@
 import os
-import zipfile
 
 def unzip_all_zips(root_folder):
+    import zipfile
+
     for dirpath, dirnames, filenames in os.walk(root_folder):
         for filename in filenames:
             if filename.endswith('.zip'):
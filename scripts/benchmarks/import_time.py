@@ -0,0 +1,70 @@
+# import_time.py
+# Measures how long it takes a fresh interpreter to import each step of the
+# pipeline, and checks that the heavy dependencies are not pulled in eagerly.
+#
+#   python3 benchmarks/import_time.py [--repeats N] [--budget MS]
+#
+# Exits non-zero if a heavy dependency is loaded, or if --budget is given and
+# any module's import overhead (over bare interpreter startup) exceeds it.
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    'accessible_docs',
+    'accessible_docs.fsutils',
+    'accessible_docs.cleanup',
+    'accessible_docs.moveup',
+    'accessible_docs.crawford_remove_duedate',
+    'accessible_docs.download',
+]
+
+HEAVY_MODULES = ['bs4', 'googleapiclient', 'google.oauth2']
+
+CHECK = (
+    "import sys, {module}; "
+    "loaded = [m for m in {heavy!r} if m in sys.modules]; "
+    "print(','.join(loaded))"
+)
+
+def run(code):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [SCRIPTS_DIR, env.get('PYTHONPATH')]))
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True)
+    return time.perf_counter() - start, result.stdout.strip()
+
+def main(repeats, budget_ms=None):
+    baseline = min(run('pass')[0] for _ in range(repeats))
+    print(f"{'interpreter startup':45} {baseline * 1000:8.1f} ms")
+
+    failed = False
+    for module in MODULES:
+        code = CHECK.format(module=module, heavy=HEAVY_MODULES)
+        timings = []
+        for _ in range(repeats):
+            elapsed, loaded = run(code)
+            timings.append(elapsed)
+        overhead = (min(timings) - baseline) * 1000
+        notes = []
+        if loaded:
+            notes.append(f"eagerly loaded: {loaded}")
+        if budget_ms is not None and overhead > budget_ms:
+            notes.append(f"over budget of {budget_ms:.1f} ms")
+        note = ''.join(f"  {n}" for n in notes)
+        print(f"{module:45} {overhead:+8.1f} ms{note}")
+        failed = failed or bool(notes)
+
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure import time of the accessible_docs modules.")
+    parser.add_argument('--repeats', type=int, default=5, help="runs per module; the fastest one is reported")
+    parser.add_argument('--budget', type=float, metavar='MS', help="fail if any module's import overhead exceeds this")
+    args = parser.parse_args()
+    main(args.repeats, args.budget)
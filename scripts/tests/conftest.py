@@ -0,0 +1,21 @@
+import pytest
+
+@pytest.fixture
+def make_tree():
+    """Create files (and their folders) under root from a {relative path: contents} dict."""
+    def make(root, files):
+        for relpath, contents in files.items():
+            path = root / relpath
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(contents)
+    return make
+
+@pytest.fixture
+def read_tree():
+    """Return {relative path: contents} for every file under root."""
+    def read(root):
+        return {
+            path.relative_to(root).as_posix(): path.read_text()
+            for path in sorted(root.rglob('*')) if path.is_file()
+        }
+    return read
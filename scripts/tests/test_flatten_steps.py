@@ -0,0 +1,89 @@
+from accessible_docs import crawford_remove_duedate, move_to_root_folder
+from accessible_docs.fsutils import move_folder_contents_to_parent
+
+def test_move_to_root_folder_keeps_folder_with_conflicts(tmp_path, make_tree, read_tree):
+    make_tree(tmp_path, {
+        'Course/Full Remediation/Completed/Week 1/a.html': 'a',
+        'Course/Full Remediation/Completed/b.html': 'b',
+        'Course/Week 1': 'a file in the way',
+    })
+
+    move_to_root_folder.main(tmp_path)
+
+    assert read_tree(tmp_path) == {
+        'Course/Full Remediation/Completed/Week 1/a.html': 'a',
+        'Course/Week 1': 'a file in the way',
+        'Course/b.html': 'b',
+    }
+
+def test_move_to_root_folder_deletes_folder_without_conflicts(tmp_path, make_tree, read_tree):
+    make_tree(tmp_path, {'Course/Magnification/Completed/Week 1/a.html': 'a'})
+
+    move_to_root_folder.main(tmp_path)
+
+    assert read_tree(tmp_path) == {'Course/Week 1/a.html': 'a'}
+
+def test_crawford_remove_duedate_keeps_folder_with_conflicts(tmp_path, make_tree, read_tree):
+    make_tree(tmp_path, {
+        'Course/Due Jan 5/notes/a.html': 'a',
+        'Course/Due Jan 5/b.html': 'b',
+        'Course/notes': 'a file in the way',
+        'Course/Due Feb 2/c.html': 'c',
+    })
+
+    crawford_remove_duedate.main(tmp_path)
+
+    assert read_tree(tmp_path) == {
+        'Course/Due Jan 5/notes/a.html': 'a',
+        'Course/b.html': 'b',
+        'Course/c.html': 'c',
+        'Course/notes': 'a file in the way',
+    }
+
+def test_moveup_layout_reports_conflicts_and_keeps_source(tmp_path, capsys, make_tree, read_tree):
+    # moveup moves a folder's contents up two levels, into the folder above its parent.
+    make_tree(tmp_path, {
+        'Course/Unit/Part/Week 1/a.html': 'a',
+        'Course/Unit/Part/Week 1/b.html': 'b',
+        'Course/Unit/a.html/x': 'a folder in the way',
+    })
+    unit = tmp_path / 'Course' / 'Unit'
+    week = unit / 'Part' / 'Week 1'
+
+    conflicts = move_folder_contents_to_parent(str(week), str(unit), verbose=True)
+
+    assert [c.reason for c in conflicts] == ['file over folder']
+    assert read_tree(tmp_path) == {
+        'Course/Unit/Part/Week 1/a.html': 'a',
+        'Course/Unit/a.html/x': 'a folder in the way',
+        'Course/Unit/b.html': 'b',
+    }
+    out = capsys.readouterr().out
+    assert f"Moved '{week / 'b.html'}' to '{unit / 'b.html'}'." in out
+    assert f"Conflict: could not move '{week / 'a.html'}'" in out
+
+def test_crawford_remove_duedate_keeps_folder_named_like_itself(tmp_path, make_tree, read_tree):
+    make_tree(tmp_path, {
+        'Course/Due Jan 5/Due Jan 5/a.html': 'a',
+        'Course/Due Jan 5/b.html': 'b',
+    })
+
+    crawford_remove_duedate.main(tmp_path)
+
+    assert read_tree(tmp_path) == {
+        'Course/Due Jan 5/Due Jan 5/a.html': 'a',
+        'Course/b.html': 'b',
+    }
+
+def test_move_to_root_folder_keeps_folder_named_like_an_ancestor(tmp_path, make_tree, read_tree):
+    make_tree(tmp_path, {
+        'Course/Full Remediation/Completed/Full Remediation/a.html': 'a',
+        'Course/Full Remediation/Completed/b.html': 'b',
+    })
+
+    move_to_root_folder.main(tmp_path)
+
+    assert read_tree(tmp_path) == {
+        'Course/Full Remediation/Completed/Full Remediation/a.html': 'a',
+        'Course/b.html': 'b',
+    }
@@ -0,0 +1,161 @@
+import errno
+import os
+
+import pytest
+
+from accessible_docs import fsutils
+from accessible_docs.fsutils import MoveConflict, move_folder_contents_to_parent, rename_noreplace
+
+def test_merges_nested_folders(tmp_path, make_tree, read_tree):
+    make_tree(tmp_path, {
+        'child/a/b/new.txt': 'new',
+        'child/a/top.txt': 'top',
+        'parent/a/b/old.txt': 'old',
+    })
+
+    conflicts = move_folder_contents_to_parent(tmp_path / 'child', tmp_path / 'parent')
+
+    assert conflicts == []
+    assert read_tree(tmp_path / 'parent') == {
+        'a/b/new.txt': 'new',
+        'a/b/old.txt': 'old',
+        'a/top.txt': 'top',
+    }
+    assert list((tmp_path / 'child').iterdir()) == []
+
+def test_replaces_colliding_file(tmp_path, make_tree, read_tree):
+    make_tree(tmp_path, {'child/doc.html': 'new', 'parent/doc.html': 'old'})
+
+    assert move_folder_contents_to_parent(tmp_path / 'child', tmp_path / 'parent') == []
+    assert read_tree(tmp_path) == {'parent/doc.html': 'new'}
+
+def test_folder_over_file_is_a_conflict_and_keeps_source(tmp_path, make_tree, read_tree):
+    make_tree(tmp_path, {'child/images/a.png': 'png', 'parent/images': 'not a folder'})
+
+    conflicts = move_folder_contents_to_parent(tmp_path / 'child', tmp_path / 'parent')
+
+    assert conflicts == [MoveConflict(
+        str(tmp_path / 'child' / 'images'), str(tmp_path / 'parent' / 'images'), 'folder over file')]
+    assert read_tree(tmp_path) == {'child/images/a.png': 'png', 'parent/images': 'not a folder'}
+
+def test_file_over_folder_is_a_conflict(tmp_path, make_tree, read_tree):
+    make_tree(tmp_path, {'child/images': 'file', 'parent/images/a.png': 'png'})
+
+    [conflict] = move_folder_contents_to_parent(tmp_path / 'child', tmp_path / 'parent')
+
+    assert conflict.reason == 'file over folder'
+    assert read_tree(tmp_path) == {'child/images': 'file', 'parent/images/a.png': 'png'}
+
+def test_folder_containing_the_source_is_a_conflict(tmp_path, make_tree, read_tree):
+    # Flattening parent/x/child into parent: 'x' would be merged into the source's own ancestor.
+    make_tree(tmp_path, {
+        'parent/x/child/x/a.txt': 'a',
+        'parent/x/child/c.txt': 'c',
+    })
+    child = tmp_path / 'parent' / 'x' / 'child'
+
+    conflicts = move_folder_contents_to_parent(child, tmp_path / 'parent')
+
+    assert conflicts == [MoveConflict(
+        str(child / 'x'), str(tmp_path / 'parent' / 'x'), 'destination contains the source folder')]
+    assert read_tree(tmp_path) == {
+        'parent/c.txt': 'c',
+        'parent/x/child/x/a.txt': 'a',
+    }
+
+def test_merged_source_with_only_ds_store_is_removed(tmp_path, make_tree, read_tree):
+    make_tree(tmp_path, {
+        'child/a/.DS_Store': '',
+        'child/a/x.txt': 'x',
+        'parent/a/y.txt': 'y',
+    })
+
+    assert move_folder_contents_to_parent(tmp_path / 'child', tmp_path / 'parent') == []
+    assert not (tmp_path / 'child' / 'a').exists()
+    assert read_tree(tmp_path / 'parent') == {'a/x.txt': 'x', 'a/y.txt': 'y'}
+
+def test_verbose_off_prints_only_conflicts(tmp_path, capsys, make_tree):
+    make_tree(tmp_path, {'child/a.txt': 'new', 'child/b.txt': 'b', 'parent/a.txt': 'old'})
+
+    move_folder_contents_to_parent(tmp_path / 'child', tmp_path / 'parent')
+
+    assert capsys.readouterr().out == ''
+
+def fake_renameat2(err):
+    def renameat2(olddirfd, oldpath, newdirfd, newpath, flags):
+        raise OSError(err, os.strerror(err), os.fsdecode(oldpath), None, os.fsdecode(newpath))
+    return renameat2
+
+@pytest.mark.parametrize('renameat2', [False, fake_renameat2(errno.EINVAL), fake_renameat2(errno.ENOSYS)],
+                         ids=['missing', 'EINVAL', 'ENOSYS'])
+def test_rename_noreplace_fallback(tmp_path, monkeypatch, renameat2, make_tree, read_tree):
+    monkeypatch.setattr(fsutils, '_renameat2', renameat2)
+    make_tree(tmp_path, {'a': 'a', 'b': 'b'})
+
+    with pytest.raises(FileExistsError):
+        rename_noreplace(tmp_path / 'a', tmp_path / 'b')
+    rename_noreplace(tmp_path / 'a', tmp_path / 'c')
+
+    assert read_tree(tmp_path) == {'b': 'b', 'c': 'a'}
+
+def test_rename_noreplace_refuses_to_overwrite(tmp_path, make_tree, read_tree):
+    make_tree(tmp_path, {'a': 'a', 'b': 'b'})
+
+    with pytest.raises(FileExistsError):
+        rename_noreplace(tmp_path / 'a', tmp_path / 'b')
+    assert read_tree(tmp_path) == {'a': 'a', 'b': 'b'}
+
+def test_cross_device_entries_are_copied(tmp_path, monkeypatch, make_tree, read_tree):
+    # Make every rename out of the child folder fail as if it were on another device.
+    child = str(tmp_path / 'child')
+    real_replace = os.replace
+
+    def renameat2(olddirfd, oldpath, newdirfd, newpath, flags):
+        if os.fsdecode(oldpath).startswith(child):
+            raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+        os.rename(oldpath, newpath)
+
+    def replace(src, dst):
+        if os.fsdecode(src).startswith(child):
+            raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+        real_replace(src, dst)
+
+    monkeypatch.setattr(fsutils, '_renameat2', renameat2)
+    monkeypatch.setattr(os, 'replace', replace)
+    make_tree(tmp_path, {
+        'child/a/b/new.txt': 'new',
+        'child/doc.html': 'new doc',
+        'child/plain.txt': 'plain',
+        'parent/a/old.txt': 'old',
+        'parent/doc.html': 'old doc',
+        'parent/.doc.html.tmp': 'unrelated',
+    })
+
+    assert move_folder_contents_to_parent(tmp_path / 'child', tmp_path / 'parent') == []
+    assert read_tree(tmp_path) == {
+        'parent/.doc.html.tmp': 'unrelated',
+        'parent/a/b/new.txt': 'new',
+        'parent/a/old.txt': 'old',
+        'parent/doc.html': 'new doc',
+        'parent/plain.txt': 'plain',
+    }
+
+def test_failed_cross_device_replace_keeps_source(tmp_path, monkeypatch, make_tree, read_tree):
+    def replace(src, dst):
+        raise OSError(errno.EXDEV if 'child' in os.fsdecode(src) else errno.EIO, 'fail')
+
+    monkeypatch.setattr(os, 'replace', replace)
+    make_tree(tmp_path, {'child/doc.html': 'new', 'parent/doc.html': 'old'})
+
+    with pytest.raises(OSError):
+        move_folder_contents_to_parent(tmp_path / 'child', tmp_path / 'parent')
+    assert read_tree(tmp_path) == {'child/doc.html': 'new', 'parent/doc.html': 'old'}
+
+def test_has_files_ignores_symlinked_folders(tmp_path):
+    (tmp_path / 'target').mkdir()
+    (tmp_path / 'course').mkdir()
+    (tmp_path / 'course' / 'link').symlink_to(tmp_path / 'target')
+
+    assert not fsutils.has_files(tmp_path / 'course')
+    (tmp_path / 'course' / 'file').write_text('')
+    assert fsutils.has_files(tmp_path / 'course')